@@ -1,97 +1,96 @@
-"""HTTP clients for all Servarr services with retry, dry-run, and auth."""
+"""HTTP clients for all Servarr services with dry-run and auth."""
 
-import time
 import logging
 
 import requests
 
+from .http_pool import new_session
+
 log = logging.getLogger(__name__)
 
-# Retry settings
-MAX_RETRIES = 3
-BACKOFF_BASE = 2  # seconds
+# (connect, read) timeouts in seconds; a short connect timeout bounds how long
+# an unreachable host can stall a run
+DEFAULT_TIMEOUT = (5, 30)
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    _loads = json.loads
+
+
+def _return_body(resp: requests.Response):
+    """Decode a JSON response body, or return the raw text otherwise."""
+    if "json" in resp.headers.get("content-type", ""):
+        return _loads(resp.content)
+    return resp.text
 
 
 class _BaseClient:
-    """Shared retry and dry-run logic."""
+    """Shared request and dry-run logic; retries live in lib/http_pool."""
 
-    def __init__(self, base_url: str, *, dry_run: bool = False):
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        dry_run: bool = False,
+        session: requests.Session | None = None,
+        timeout: float | tuple[float, float] = DEFAULT_TIMEOUT,
+    ):
         self.base_url = base_url.rstrip("/")
         self.dry_run = dry_run
-        self.session = requests.Session()
+        self.session = new_session() if session is None else session
+        self.timeout = timeout
+        # Auth headers are fixed for a client's lifetime; subclasses fill them
+        # in once here rather than rebuilding them per request. A caller-
+        # supplied Session may be shared, so they never go on session.headers.
+        self._static_headers: dict = {}
+        self._url_cache: dict[str, str] = {}
 
     # --- internal helpers ---
 
-    def _headers(self) -> dict:
-        """Override in subclasses to inject auth headers."""
-        return {}
-
     def _url(self, path: str) -> str:
-        return f"{self.base_url}/{path.lstrip('/')}"
+        # Paths come from a small fixed set, so memoize their full URLs
+        url = self._url_cache.get(path)
+        if url is None:
+            url = self._url_cache[path] = f"{self.base_url}/{path.lstrip('/')}"
+        return url
+
+    def _send(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Send a single HTTP request; retries are handled by the mounted adapter."""
+        if kwargs.get("headers"):
+            headers = {**self._static_headers, **kwargs.pop("headers")}
+        else:
+            kwargs.pop("headers", None)
+            headers = self._static_headers
+        return self.session.request(
+            method, self._url(path), headers=headers, timeout=self.timeout, **kwargs
+        )
 
     def _request(self, method: str, path: str, **kwargs) -> requests.Response:
-        """Execute an HTTP request with retry on 5xx / connection errors."""
-        url = self._url(path)
-        headers = {**self._headers(), **kwargs.pop("headers", {})}
-
-        for attempt in range(1, MAX_RETRIES + 1):
-            try:
-                resp = self.session.request(
-                    method, url, headers=headers, timeout=30, **kwargs
-                )
-                # 4xx: client error — log the response body and fail immediately
-                if 400 <= resp.status_code < 500:
-                    body = resp.text[:1000]
-                    log.error(
-                        "HTTP %d from %s %s — body: %s",
-                        resp.status_code,
-                        method.upper(),
-                        url,
-                        body,
-                    )
-                    resp.raise_for_status()
-
-                # 5xx: server error — retryable
-                if resp.status_code >= 500:
-                    raise requests.exceptions.HTTPError(
-                        f"{resp.status_code} Server Error", response=resp
-                    )
-                return resp
-            except (
-                requests.exceptions.ConnectionError,
-                requests.exceptions.HTTPError,
-            ) as exc:
-                # Never retry client errors (4xx)
-                if (
-                    isinstance(exc, requests.exceptions.HTTPError)
-                    and exc.response is not None
-                    and exc.response.status_code < 500
-                ):
-                    raise
-                if attempt == MAX_RETRIES:
-                    raise
-                wait = BACKOFF_BASE**attempt
-                log.warning(
-                    "Attempt %d/%d failed for %s %s: %s — retrying in %ds",
-                    attempt,
-                    MAX_RETRIES,
-                    method.upper(),
-                    url,
-                    exc,
-                    wait,
-                )
-                time.sleep(wait)
-        # unreachable, but keeps type checkers happy
-        raise RuntimeError("Exhausted retries")
+        """Execute an HTTP request and raise on error status."""
+        resp = self._send(method, path, **kwargs)
+        # 4xx: client error — log the response body before failing
+        if 400 <= resp.status_code < 500:
+            log.error(
+                "HTTP %d from %s %s — body: %s",
+                resp.status_code,
+                method.upper(),
+                resp.url,
+                resp.text[:1000],
+            )
+        resp.raise_for_status()
+        return resp
 
     # --- public API ---
 
     def get(self, path: str, **kwargs):
         """GET always allowed (even in dry-run)."""
         resp = self._request("GET", path, **kwargs)
-        if resp.headers.get("content-type", "").startswith("application/json"):
-            return resp.json()
-        return resp.text
+        return _return_body(resp)
 
     def post(self, path: str, **kwargs):
         """POST — skipped in dry-run for mutations."""
@@ -99,9 +98,7 @@ class _BaseClient:
             log.info("[DRY-RUN] Would POST %s", self._url(path))
             return None
         resp = self._request("POST", path, **kwargs)
-        if resp.headers.get("content-type", "").startswith("application/json"):
-            return resp.json()
-        return resp.text
+        return _return_body(resp)
 
     def put(self, path: str, **kwargs):
         """PUT — skipped in dry-run for mutations."""
@@ -109,9 +106,7 @@ class _BaseClient:
             log.info("[DRY-RUN] Would PUT %s", self._url(path))
             return None
         resp = self._request("PUT", path, **kwargs)
-        if resp.headers.get("content-type", "").startswith("application/json"):
-            return resp.json()
-        return resp.text
+        return _return_body(resp)
 
     def delete(self, path: str, **kwargs):
         """DELETE — skipped in dry-run."""
@@ -119,38 +114,57 @@ class _BaseClient:
             log.info("[DRY-RUN] Would DELETE %s", self._url(path))
             return None
         resp = self._request("DELETE", path, **kwargs)
-        if resp.headers.get("content-type", "").startswith("application/json"):
-            return resp.json()
-        return resp.text
+        return _return_body(resp)
 
 
 class ArrClient(_BaseClient):
     """Client for Sonarr, Radarr, and Prowlarr (X-Api-Key auth)."""
 
-    def __init__(self, base_url: str, api_key: str, *, dry_run: bool = False):
-        super().__init__(base_url, dry_run=dry_run)
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        *,
+        dry_run: bool = False,
+        session: requests.Session | None = None,
+        timeout: float | tuple[float, float] = DEFAULT_TIMEOUT,
+    ):
+        super().__init__(
+            base_url, dry_run=dry_run, session=session, timeout=timeout
+        )
         self.api_key = api_key
-
-    def _headers(self) -> dict:
-        return {"X-Api-Key": self.api_key}
+        self._static_headers = {"X-Api-Key": api_key}
 
 
 class QbitClient(_BaseClient):
     """Client for qBittorrent (session cookie auth).
 
-    Authenticates via POST /api/v2/auth/login, then reuses the SID cookie.
+    Authenticates lazily: a request that comes back 403 triggers
+    POST /api/v2/auth/login and is replayed once with the new SID cookie.
+    This also renews a SID that expires mid-run. After a failed login no
+    further logins are attempted, so bad credentials fail fast.
     """
 
     def __init__(
-        self, base_url: str, username: str, password: str, *, dry_run: bool = False
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        *,
+        dry_run: bool = False,
+        session: requests.Session | None = None,
+        timeout: float | tuple[float, float] = DEFAULT_TIMEOUT,
     ):
-        super().__init__(base_url, dry_run=dry_run)
+        super().__init__(
+            base_url, dry_run=dry_run, session=session, timeout=timeout
+        )
         self._qbit_username = username
         self._qbit_password = password
-        self._authenticated = False
+        self._auth_attempted = False
 
     def login(self):
         """Authenticate and store SID cookie in the session."""
+        self._auth_attempted = True
         resp = self._request(
             "POST",
             "api/v2/auth/login",
@@ -159,37 +173,55 @@ class QbitClient(_BaseClient):
         body = resp.text if isinstance(resp, requests.Response) else resp
         if body != "Ok.":
             raise RuntimeError(f"qBittorrent login failed: {body}")
-        self._authenticated = True
+        # Succeeded, so a later 403 (expired SID) may log in again
+        self._auth_attempted = False
         log.info("qBittorrent: authenticated successfully")
 
-    def get(self, path: str, **kwargs):
-        if not self._authenticated:
+    def _send(self, method: str, path: str, **kwargs) -> requests.Response:
+        resp = super()._send(method, path, **kwargs)
+        if (
+            resp.status_code == 403
+            and not self._auth_attempted
+            and path != "api/v2/auth/login"
+        ):
             self.login()
-        return super().get(path, **kwargs)
-
-    def post(self, path: str, **kwargs):
-        if not self._authenticated and path != "api/v2/auth/login":
-            self.login()
-        return super().post(path, **kwargs)
+            resp = super()._send(method, path, **kwargs)
+        return resp
 
 
 class JellyfinClient(_BaseClient):
     """Client for Jellyfin (MediaBrowser token auth)."""
 
-    def __init__(self, base_url: str, api_key: str, *, dry_run: bool = False):
-        super().__init__(base_url, dry_run=dry_run)
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        *,
+        dry_run: bool = False,
+        session: requests.Session | None = None,
+        timeout: float | tuple[float, float] = DEFAULT_TIMEOUT,
+    ):
+        super().__init__(
+            base_url, dry_run=dry_run, session=session, timeout=timeout
+        )
         self.api_key = api_key
-
-    def _headers(self) -> dict:
-        return {"Authorization": f'MediaBrowser Token="{self.api_key}"'}
+        self._static_headers = {"Authorization": f'MediaBrowser Token="{api_key}"'}
 
 
 class JellyseerrClient(_BaseClient):
     """Client for Jellyseerr (X-Api-Key auth)."""
 
-    def __init__(self, base_url: str, api_key: str, *, dry_run: bool = False):
-        super().__init__(base_url, dry_run=dry_run)
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        *,
+        dry_run: bool = False,
+        session: requests.Session | None = None,
+        timeout: float | tuple[float, float] = DEFAULT_TIMEOUT,
+    ):
+        super().__init__(
+            base_url, dry_run=dry_run, session=session, timeout=timeout
+        )
         self.api_key = api_key
-
-    def _headers(self) -> dict:
-        return {"X-Api-Key": self.api_key}
+        self._static_headers = {"X-Api-Key": api_key}
@@ -1,9 +1,14 @@
 """Load config/config.yml, merge with environment secrets, resolve paths."""
 
 import os
-import copy
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    # libyaml bindings not available — fall back to the pure-Python loader
+    from yaml import SafeLoader as _Loader
+
 
 def load_config(config_path: str, env: dict | None = None) -> dict:
     """Load YAML config and resolve secrets + paths from environment.
@@ -19,9 +24,9 @@ def load_config(config_path: str, env: dict | None = None) -> dict:
         env = os.environ
 
     with open(config_path) as f:
-        raw = yaml.safe_load(f)
+        raw = yaml.load(f, Loader=_Loader)
 
-    config = copy.deepcopy(raw)
+    config = raw
 
     username = _require_env(env, "ULTRA_USERNAME")
     servername = _require_env(env, "ULTRA_SERVERNAME")
@@ -69,5 +74,7 @@ def _require_env(env: dict, key: str) -> str:
 
 
 def _abs_path(home_dir: str, relative: str) -> str:
-    """Convert a home-relative path to absolute."""
-    return os.path.join(home_dir, relative)
+    """Convert a home-relative path to absolute (absolute paths pass through)."""
+    if relative.startswith("/"):
+        return relative
+    return f"{home_dir}/{relative}"
@@ -0,0 +1,92 @@
+"""Shared HTTP connection pool and retry policy for all API clients."""
+
+import random
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Retry settings
+MAX_RETRIES = 3  # total attempts, including the first
+BACKOFF_BASE = 2  # seconds; waits are 2s, 4s, ... up to MAX_BACKOFF
+MAX_BACKOFF = 8  # seconds, before jitter; also caps Retry-After
+BACKOFF_JITTER = 0.5  # seconds
+RETRY_STATUSES = (500, 502, 503, 504, 429)
+
+# Connection pool settings — every service lives on the same usbx.me host
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+
+
+class _Retry(Retry):
+    """Retry tuned to the old hand-rolled loop's timing.
+
+    urllib3 2.x retries the first failure immediately; shift the exponent
+    by one so the n-th retry waits backoff_factor * 2**(n-1). Retry-After
+    is honoured but clamped to backoff_max so one throttled response
+    cannot stall a run.
+    """
+
+    def get_backoff_time(self) -> float:
+        errors = 0
+        for entry in reversed(self.history):
+            if entry.redirect_location:
+                break
+            errors += 1
+        if errors == 0:
+            return 0
+        backoff = min(self.backoff_max, self.backoff_factor * 2 ** (errors - 1))
+        if self.backoff_jitter:
+            backoff += random.random() * self.backoff_jitter
+        return backoff
+
+    def get_retry_after(self, response) -> float | None:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.backoff_max)
+
+
+def new_adapter(*, retries: int = MAX_RETRIES) -> HTTPAdapter:
+    """Create an HTTPAdapter with a sized keep-alive pool and retry policy.
+
+    retries is the total number of attempts; 1 disables retrying.
+    """
+    # Capped exponential backoff with jitter on 5xx / 429 / connection errors.
+    # raise_on_status=False hands the final response back so raise_for_status()
+    # surfaces a normal HTTPError once retries are exhausted. read=0 keeps
+    # read timeouts from being replayed: a slow POST may already have
+    # created its resource server-side.
+    retry = _Retry(
+        total=retries - 1,
+        read=0,
+        backoff_factor=BACKOFF_BASE,
+        backoff_max=MAX_BACKOFF,
+        backoff_jitter=BACKOFF_JITTER,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    return HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=retry
+    )
+
+
+# One pooled adapter for the whole run: every client talks to the same host,
+# so they all reuse its kept-alive connections and TLS sessions.
+ADAPTER = new_adapter()
+
+
+def new_session(adapter: HTTPAdapter | None = None) -> requests.Session:
+    """Create a Session that sends through adapter (default: ADAPTER).
+
+    Each client gets its own Session, and so its own cookie jar, while the
+    connection pool underneath is shared.
+    """
+    if adapter is None:
+        adapter = ADAPTER
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -2,6 +2,7 @@
 
 import logging
 import sys
+from collections import Counter, deque
 from enum import Enum
 
 log = logging.getLogger(__name__)
@@ -15,85 +16,92 @@ class Status(Enum):
     SKIPPED = "skipped"
 
 
+# Summary markers per status
+_ICONS = {
+    Status.SUCCESS: "OK",
+    Status.FAILED: "FAIL",
+    Status.SKIPPED: "SKIP",
+    Status.IN_PROGRESS: "...",
+    Status.PENDING: "---",
+}
+
+
 class SummaryLogger:
-    """Track per-service results and print a final summary."""
+    """Track per-service results and print a final summary.
+
+    Updates are queued as events and only folded into per-service state
+    when the summary is read, so recording a result is a single append
+    that is safe to call from worker threads (deque appends are atomic).
+    """
 
     def __init__(self):
         self._services: dict[str, dict] = {}
-
-    def _ensure(self, service: str):
-        if service not in self._services:
-            self._services[service] = {
-                "status": Status.PENDING,
-                "changes": [],
-                "errors": [],
-            }
+        # (service, new status or None, changes, errors)
+        self._events: deque[tuple] = deque()
+
+    def _record(self, service, status=None, changes=(), errors=()):
+        self._events.append((service, status, changes, errors))
+
+    def _drain(self):
+        """Apply queued events in the order they were recorded."""
+        while self._events:
+            service, status, changes, errors = self._events.popleft()
+            info = self._services.setdefault(
+                service, {"status": Status.PENDING, "changes": [], "errors": []}
+            )
+            if status is not None:
+                info["status"] = status
+            info["changes"].extend(changes)
+            info["errors"].extend(errors)
 
     def log_change(self, service: str, message: str):
         """Record a successful change."""
-        self._ensure(service)
-        self._services[service]["changes"].append(message)
+        self._record(service, changes=(message,))
         log.info("[%s] %s", service, message)
 
     def log_skip(self, service: str, reason: str):
         """Record that a service was skipped."""
-        self._ensure(service)
-        self._services[service]["status"] = Status.SKIPPED
-        self._services[service]["changes"].append(f"Skipped: {reason}")
+        self._record(service, Status.SKIPPED, changes=(f"Skipped: {reason}",))
         log.info("[%s] Skipped: %s", service, reason)
 
     def log_error(self, service: str, error: str):
         """Record an error for a service."""
-        self._ensure(service)
-        self._services[service]["errors"].append(error)
+        self._record(service, errors=(error,))
         log.error("[%s] ERROR: %s", service, error)
 
+    def mark_pending(self, service: str):
+        self._record(service, Status.PENDING)
+
     def mark_in_progress(self, service: str):
-        self._ensure(service)
-        self._services[service]["status"] = Status.IN_PROGRESS
+        self._record(service, Status.IN_PROGRESS)
 
     def mark_success(self, service: str, changes: list[str] | None = None):
-        self._ensure(service)
-        self._services[service]["status"] = Status.SUCCESS
-        if changes:
-            self._services[service]["changes"].extend(changes)
+        self._record(service, Status.SUCCESS, changes=tuple(changes or ()))
 
     def mark_failed(self, service: str, error: str):
-        self._ensure(service)
-        self._services[service]["status"] = Status.FAILED
-        self._services[service]["errors"].append(error)
+        self._record(service, Status.FAILED, errors=(error,))
         log.error("[%s] FAILED: %s", service, error)
 
     def has_failures(self) -> bool:
+        self._drain()
         return any(s["status"] == Status.FAILED for s in self._services.values())
 
     def print_summary(self):
         """Print a formatted summary suitable for GitHub Actions logs."""
-        counts = {s: 0 for s in Status}
-        for info in self._services.values():
-            counts[info["status"]] += 1
+        self._drain()
+        counts = Counter(info["status"] for info in self._services.values())
 
-        print("\n" + "=" * 60)
-        print("  SETUP SUMMARY")
-        print("=" * 60)
+        # Buffer the whole report and emit it in a single write
+        lines: list[str] = ["", "=" * 60, "  SETUP SUMMARY", "=" * 60]
 
         for name, info in self._services.items():
-            status = info["status"]
-            icon = {
-                Status.SUCCESS: "OK",
-                Status.FAILED: "FAIL",
-                Status.SKIPPED: "SKIP",
-                Status.IN_PROGRESS: "...",
-                Status.PENDING: "---",
-            }.get(status, "???")
-
-            print(f"\n  [{icon}] {name}")
-            for change in info["changes"]:
-                print(f"        + {change}")
-            for error in info["errors"]:
-                print(f"        ! {error}")
-
-        print("\n" + "-" * 60)
+            icon = _ICONS.get(info["status"], "???")
+
+            lines.append(f"\n  [{icon}] {name}")
+            lines.extend(f"        + {change}" for change in info["changes"])
+            lines.extend(f"        ! {error}" for error in info["errors"])
+
+        lines.append("\n" + "-" * 60)
         parts = []
         if counts[Status.SUCCESS]:
             parts.append(f"{counts[Status.SUCCESS]} succeeded")
@@ -101,13 +109,14 @@ class SummaryLogger:
             parts.append(f"{counts[Status.FAILED]} failed")
         if counts[Status.SKIPPED]:
             parts.append(f"{counts[Status.SKIPPED]} skipped")
-        print(f"  Result: {', '.join(parts) or 'nothing to do'}")
+        lines.append(f"  Result: {', '.join(parts) or 'nothing to do'}")
 
         if self.has_failures():
             failed = [
                 n for n, i in self._services.items() if i["status"] == Status.FAILED
             ]
-            print(f"  Re-run with: --services {','.join(failed)}")
+            lines.append(f"  Re-run with: --services {','.join(failed)}")
 
-        print("=" * 60 + "\n")
+        lines.append("=" * 60 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
         sys.stdout.flush()
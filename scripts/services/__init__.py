@@ -1,9 +1,4 @@
-from .qbittorrent import configure_qbittorrent
-from .sonarr import configure_sonarr
-from .radarr import configure_radarr
-from .prowlarr import configure_prowlarr
-from .jellyfin import configure_jellyfin
-from .jellyseerr import configure_jellyseerr
+import importlib
 
 __all__ = [
     "configure_qbittorrent",
@@ -13,3 +8,13 @@ __all__ = [
     "configure_jellyfin",
     "configure_jellyseerr",
 ]
+
+
+def __getattr__(name: str):
+    # Import service modules on first access so loading one service
+    # (e.g. services.radarr) doesn't pull in all the others
+    if name in __all__:
+        module_name = name.removeprefix("configure_")
+        module = importlib.import_module(f".{module_name}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -49,17 +49,17 @@ def configure_jellyfin(
 
     # Get existing virtual folders (libraries)
     existing = client.get("Library/VirtualFolders")
-    existing_names = {lib["Name"] for lib in existing}
+    existing_names = frozenset(lib["Name"] for lib in existing)
 
-    created_any = False
-    for lib in libraries:
+    needed = [lib for lib in libraries if lib["name"] not in existing_names]
+    if not needed:
+        log.info("All Jellyfin libraries already exist")
+        return changes
+
+    for lib in needed:
         lib_name = lib["name"]
         lib_path = f"{home_dir}/{lib['path']}"
 
-        if lib_name in existing_names:
-            log.info("Jellyfin library already exists: %s", lib_name)
-            continue
-
         # POST /Library/VirtualFolders
         # - name, collectionType, paths, refreshLibrary as query params
         # - LibraryOptions as JSON body
@@ -75,11 +75,9 @@ def configure_jellyfin(
             json={"LibraryOptions": {}},
         )
         changes.append(f"Created library: {lib_name} ({lib_path})")
-        created_any = True
 
-    # Trigger a library refresh if we created anything
-    if created_any:
-        client.post("Library/Refresh")
-        changes.append("Triggered library refresh")
+    # Trigger a library refresh once the new libraries are in place
+    client.post("Library/Refresh")
+    changes.append("Triggered library refresh")
 
     return changes
@@ -1,8 +1,10 @@
 """Jellyseerr configuration — Sonarr and Radarr server connections."""
 
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
-from lib.api_client import JellyseerrClient
+from lib.api_client import ArrClient, JellyseerrClient
 
 log = logging.getLogger(__name__)
 
@@ -14,10 +16,21 @@ _QUALITY_PROFILES = {
     "radarr2": "UHD Bluray + WEB",
 }
 
+# Display names for the known Arr instances
+_DISPLAY_NAMES = {
+    "sonarr": "Sonarr",
+    "sonarr2": "Sonarr 4K",
+    "radarr": "Radarr",
+    "radarr2": "Radarr 4K",
+}
+
 # Which instances are default for standard vs 4K requests
 _DEFAULT_STANDARD = {"sonarr", "radarr"}
 _DEFAULT_4K = {"sonarr2", "radarr2"}
 
+# Arr instances are configured concurrently; keep within the HTTP pool size
+_MAX_WORKERS = 4
+
 
 def configure_jellyseerr(
     config: dict, service_name: str, *, dry_run: bool = False
@@ -50,43 +63,58 @@ def _configure_sonarr_servers(client: JellyseerrClient, config: dict) -> list[st
 
     host = f"{config['username']}.{config['servername']}.usbx.me"
 
-    for name, inst in sonarr_instances.items():
-        base_url = inst.get("app_path", "")
-        profile_name = _QUALITY_PROFILES.get(name, "")
-        is_default = name in _DEFAULT_STANDARD
-        is_4k = name in _DEFAULT_4K
-
-        # Check if this instance already exists by matching baseUrl
-        found = _find_existing_server(existing, base_url)
-
-        # Resolve quality profile, language profile, and root folder
-        profile_id, resolved_profile_name = _resolve_profile(client, inst, profile_name)
-        lang_profile_id = _resolve_language_profile_id(inst)
-        root_folder = inst.get("root_folder", "")
-
-        payload = {
-            "name": name.title().replace("2", " 4K"),
-            "hostname": host,
-            "port": 443,
-            "useSsl": True,
-            "apiKey": inst["api_key"],
-            "baseUrl": base_url,
-            "activeProfileId": profile_id,
-            "activeProfileName": resolved_profile_name,
-            "activeLanguageProfileId": lang_profile_id,
-            "activeDirectory": root_folder,
-            "isDefault": is_default,
-            "is4k": is_4k,
-            "enableSeasonFolders": True,
-        }
-
-        if found:
-            # Update existing — id is read-only, passed via URL only
-            client.put(f"api/v1/settings/sonarr/{found['id']}", json=payload)
-            changes.append(f"Updated Jellyseerr Sonarr server: {name}")
-        else:
-            client.post("api/v1/settings/sonarr", json=payload)
-            changes.append(f"Added Jellyseerr Sonarr server: {name}")
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as ex:
+        results = ex.map(
+            lambda kv: _configure_sonarr_server(client, existing, host, *kv),
+            sonarr_instances.items(),
+        )
+        for result in results:
+            changes.extend(result)
+
+    return changes
+
+
+def _configure_sonarr_server(
+    client: JellyseerrClient, existing: list, host: str, name: str, inst: dict
+) -> list[str]:
+    """Add or update a single Sonarr instance in Jellyseerr."""
+    changes = []
+    base_url = inst.get("app_path", "")
+    profile_name = _QUALITY_PROFILES.get(name, "")
+    is_default = name in _DEFAULT_STANDARD
+    is_4k = name in _DEFAULT_4K
+
+    # Check if this instance already exists by matching baseUrl
+    found = _find_existing_server(existing, base_url)
+
+    # Resolve quality profile, language profile, and root folder
+    profile_id, resolved_profile_name = _resolve_profile(client, inst, profile_name)
+    lang_profile_id = _resolve_language_profile_id(inst)
+    root_folder = inst.get("root_folder", "")
+
+    payload = {
+        "name": _DISPLAY_NAMES.get(name, name.title()),
+        "hostname": host,
+        "port": 443,
+        "useSsl": True,
+        "apiKey": inst["api_key"],
+        "baseUrl": base_url,
+        "activeProfileId": profile_id,
+        "activeProfileName": resolved_profile_name,
+        "activeLanguageProfileId": lang_profile_id,
+        "activeDirectory": root_folder,
+        "isDefault": is_default,
+        "is4k": is_4k,
+        "enableSeasonFolders": True,
+    }
+
+    if found:
+        # Update existing — id is read-only, passed via URL only
+        client.put(f"api/v1/settings/sonarr/{found['id']}", json=payload)
+        changes.append(f"Updated Jellyseerr Sonarr server: {name}")
+    else:
+        client.post("api/v1/settings/sonarr", json=payload)
+        changes.append(f"Added Jellyseerr Sonarr server: {name}")
 
     return changes
 
@@ -104,39 +132,54 @@ def _configure_radarr_servers(client: JellyseerrClient, config: dict) -> list[st
 
     host = f"{config['username']}.{config['servername']}.usbx.me"
 
-    for name, inst in radarr_instances.items():
-        base_url = inst.get("app_path", "")
-        profile_name = _QUALITY_PROFILES.get(name, "")
-        is_default = name in _DEFAULT_STANDARD
-        is_4k = name in _DEFAULT_4K
-
-        found = _find_existing_server(existing, base_url)
-
-        profile_id, resolved_profile_name = _resolve_profile(client, inst, profile_name)
-        root_folder = inst.get("root_folder", "")
-
-        payload = {
-            "name": name.title().replace("2", " 4K"),
-            "hostname": host,
-            "port": 443,
-            "useSsl": True,
-            "apiKey": inst["api_key"],
-            "baseUrl": base_url,
-            "activeProfileId": profile_id,
-            "activeProfileName": resolved_profile_name,
-            "activeDirectory": root_folder,
-            "minimumAvailability": "released",
-            "isDefault": is_default,
-            "is4k": is_4k,
-        }
-
-        if found:
-            # Update existing — id is read-only, passed via URL only
-            client.put(f"api/v1/settings/radarr/{found['id']}", json=payload)
-            changes.append(f"Updated Jellyseerr Radarr server: {name}")
-        else:
-            client.post("api/v1/settings/radarr", json=payload)
-            changes.append(f"Added Jellyseerr Radarr server: {name}")
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as ex:
+        results = ex.map(
+            lambda kv: _configure_radarr_server(client, existing, host, *kv),
+            radarr_instances.items(),
+        )
+        for result in results:
+            changes.extend(result)
+
+    return changes
+
+
+def _configure_radarr_server(
+    client: JellyseerrClient, existing: list, host: str, name: str, inst: dict
+) -> list[str]:
+    """Add or update a single Radarr instance in Jellyseerr."""
+    changes = []
+    base_url = inst.get("app_path", "")
+    profile_name = _QUALITY_PROFILES.get(name, "")
+    is_default = name in _DEFAULT_STANDARD
+    is_4k = name in _DEFAULT_4K
+
+    found = _find_existing_server(existing, base_url)
+
+    profile_id, resolved_profile_name = _resolve_profile(client, inst, profile_name)
+    root_folder = inst.get("root_folder", "")
+
+    payload = {
+        "name": _DISPLAY_NAMES.get(name, name.title()),
+        "hostname": host,
+        "port": 443,
+        "useSsl": True,
+        "apiKey": inst["api_key"],
+        "baseUrl": base_url,
+        "activeProfileId": profile_id,
+        "activeProfileName": resolved_profile_name,
+        "activeDirectory": root_folder,
+        "minimumAvailability": "released",
+        "isDefault": is_default,
+        "is4k": is_4k,
+    }
+
+    if found:
+        # Update existing — id is read-only, passed via URL only
+        client.put(f"api/v1/settings/radarr/{found['id']}", json=payload)
+        changes.append(f"Updated Jellyseerr Radarr server: {name}")
+    else:
+        client.post("api/v1/settings/radarr", json=payload)
+        changes.append(f"Added Jellyseerr Radarr server: {name}")
 
     return changes
 
@@ -157,9 +200,7 @@ def _resolve_language_profile_id(inst: dict) -> int:
     empty or 404, so we fall back to ID 1 (usually 'English' or 'Any').
     """
     try:
-        from lib.api_client import ArrClient
-
-        arr_client = ArrClient(inst["url"], inst["api_key"])
+        arr_client = _arr_client(inst["url"], inst["api_key"])
         profiles = arr_client.get("api/v3/languageprofile")
         if profiles:
             # Prefer 'English', fall back to first available
@@ -189,9 +230,7 @@ def _resolve_profile(
         return 0, ""
 
     try:
-        from lib.api_client import ArrClient
-
-        arr_client = ArrClient(inst["url"], inst["api_key"])
+        arr_client = _arr_client(inst["url"], inst["api_key"])
         profiles = arr_client.get("api/v3/qualityprofile")
 
         for profile in profiles:
@@ -210,3 +249,13 @@ def _resolve_profile(
         log.warning("Could not resolve profile %r: %s", profile_name, exc)
 
     return 0, ""
+
+
+@functools.lru_cache(maxsize=None)
+def _arr_client(url: str, api_key: str) -> ArrClient:
+    """Return one ArrClient per Arr instance for the whole run.
+
+    Sonarr instances are asked for both quality and language profiles, so
+    both lookups share this client rather than building one each.
+    """
+    return ArrClient(url, api_key)
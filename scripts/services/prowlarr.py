@@ -1,6 +1,7 @@
 """Prowlarr configuration — app connections to all Arr instances."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from lib.api_client import ArrClient
 
@@ -18,6 +19,17 @@ _APP_TYPES = {
     },
 }
 
+# Display names for the known Arr instances
+_DISPLAY_NAMES = {
+    "sonarr": "Sonarr",
+    "sonarr2": "Sonarr 4K",
+    "radarr": "Radarr",
+    "radarr2": "Radarr 4K",
+}
+
+# Arr instances are configured concurrently; keep within the HTTP pool size
+_MAX_WORKERS = 4
+
 
 def configure_prowlarr(
     config: dict, service_name: str, *, dry_run: bool = False
@@ -38,7 +50,7 @@ def configure_prowlarr(
         fields = {f["name"]: f["value"] for f in app.get("fields", [])}
         base_url = fields.get("baseUrl", "")
         if base_url:
-            existing_by_url[base_url] = app
+            existing_by_url[base_url] = (app, fields)
 
     # Prowlarr's own URL for the prowlarrUrl field
     prowlarr_url = prowlarr_inst["url"]
@@ -50,43 +62,13 @@ def configure_prowlarr(
         if inst.get("type") in ("sonarr", "radarr")
     }
 
-    for name, inst in arr_instances.items():
-        app_type = inst["type"]
-        type_info = _APP_TYPES[app_type]
-        arr_url = inst["url"]
-
-        # Build expected field values
-        expected_fields = {
-            "baseUrl": arr_url,
-            "apiKey": inst["api_key"],
-            "prowlarrUrl": prowlarr_url,
-        }
-
-        display_name = name.replace("2", " 4K").title()
-
-        if arr_url in existing_by_url:
-            existing = existing_by_url[arr_url]
-            current_fields = {f["name"]: f["value"] for f in existing.get("fields", [])}
-
-            needs_update = False
-            for key, val in expected_fields.items():
-                if key == "apiKey":
-                    continue  # API keys not returned
-                if current_fields.get(key) != val:
-                    needs_update = True
-                    break
-
-            if needs_update:
-                payload = _build_app_payload(display_name, type_info, expected_fields)
-                payload["id"] = existing["id"]
-                client.put(f"api/v1/applications/{existing['id']}", json=payload)
-                changes.append(f"Updated Prowlarr app: {display_name}")
-            else:
-                log.info("Prowlarr app already configured: %s", display_name)
-        else:
-            payload = _build_app_payload(display_name, type_info, expected_fields)
-            client.post("api/v1/applications", json=payload)
-            changes.append(f"Added Prowlarr app: {display_name}")
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as ex:
+        results = ex.map(
+            lambda kv: _configure_app(client, existing_by_url, prowlarr_url, *kv),
+            arr_instances.items(),
+        )
+        for result in results:
+            changes.extend(result)
 
     # Trigger indexer sync after all apps are configured
     if changes:
@@ -96,6 +78,47 @@ def configure_prowlarr(
     return changes
 
 
+def _configure_app(
+    client: ArrClient, existing_by_url: dict, prowlarr_url: str, name: str, inst: dict
+) -> list[str]:
+    """Add or update the Prowlarr application for a single Arr instance."""
+    changes = []
+    app_type = inst["type"]
+    type_info = _APP_TYPES[app_type]
+    arr_url = inst["url"]
+
+    # Build expected field values
+    expected_fields = {
+        "baseUrl": arr_url,
+        "apiKey": inst["api_key"],
+        "prowlarrUrl": prowlarr_url,
+    }
+
+    display_name = _DISPLAY_NAMES.get(name, name.title())
+
+    if arr_url in existing_by_url:
+        existing, current_fields = existing_by_url[arr_url]
+
+        if _canon(current_fields) != _canon(expected_fields):
+            payload = _build_app_payload(display_name, type_info, expected_fields)
+            payload["id"] = existing["id"]
+            client.put(f"api/v1/applications/{existing['id']}", json=payload)
+            changes.append(f"Updated Prowlarr app: {display_name}")
+        else:
+            log.info("Prowlarr app already configured: %s", display_name)
+    else:
+        payload = _build_app_payload(display_name, type_info, expected_fields)
+        client.post("api/v1/applications", json=payload)
+        changes.append(f"Added Prowlarr app: {display_name}")
+
+    return changes
+
+
+def _canon(fields: dict, keys: tuple = ("baseUrl", "prowlarrUrl")) -> tuple:
+    """Project app fields onto the comparable keys (API keys are not returned)."""
+    return tuple(fields.get(k) for k in keys)
+
+
 def _build_app_payload(name: str, type_info: dict, fields: dict) -> dict:
     """Build the Prowlarr application payload."""
     return {
@@ -1,13 +1,27 @@
 """qBittorrent configuration — preferences and categories."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
-from lib.api_client import QbitClient
+from lib.api_client import DEFAULT_TIMEOUT, QbitClient
+from lib.http_pool import new_session
 
 log = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    import json
+
+    _dumps = json.dumps
+
 # Map config keys to qBittorrent API preference keys
 _PREF_MAP = {
+    "default_save_path": "save_path",
     "torrent_management_mode": "auto_tmm_enabled",
     "torrent_content_layout": "torrent_content_layout",
     "relocate_on_category_change": "torrent_changed_tmm_enabled",
@@ -19,6 +33,27 @@ _VALUE_MAP = {
     "torrent_management_mode": {"automatic": True, "manual": False},
 }
 
+# Summary wording for API keys that don't read well on their own
+_CHANGE_LABELS = {
+    "save_path": "default save path",
+}
+
+
+def _identity(value):
+    return value
+
+
+# config key -> (API key, value translator), specialized once at import
+_COMPILED = {
+    config_key: (
+        api_key,
+        (lambda v, m=_VALUE_MAP[config_key]: m.get(v, v))
+        if config_key in _VALUE_MAP
+        else _identity,
+    )
+    for config_key, api_key in _PREF_MAP.items()
+}
+
 
 def configure_qbittorrent(
     config: dict, service_name: str, *, dry_run: bool = False
@@ -28,10 +63,17 @@ def configure_qbittorrent(
     Returns a list of changes made.
     """
     qbit_cfg = config["qbittorrent"]
-    client = QbitClient(
-        qbit_cfg["url"], qbit_cfg["username"], qbit_cfg["password"], dry_run=dry_run
-    )
-    client.login()
+    # Reuse the client validate() already logged in with, if there is one
+    client = config.get("_clients", {}).get("qbittorrent")
+    if client is None:
+        client = QbitClient(qbit_cfg["url"], qbit_cfg["username"], qbit_cfg["password"])
+    client.dry_run = dry_run
+    # A validated client is on the no-retry probe adapter and short timeouts;
+    # keep its cookie jar (the SID) but switch back to the defaults
+    session = new_session()
+    session.cookies = client.session.cookies
+    client.session = session
+    client.timeout = DEFAULT_TIMEOUT
 
     changes = []
 
@@ -46,39 +88,29 @@ def configure_qbittorrent(
 
 def _set_preferences(client: QbitClient, qbit_cfg: dict) -> list[str]:
     """Check and update global qBittorrent preferences."""
-    changes = []
     current = client.get("api/v2/app/preferences")
-    desired_prefs = qbit_cfg.get("preferences", {})
-    updates = {}
-
-    # Default save path
-    desired_save_path = qbit_cfg["default_save_path"]
-    if current.get("save_path") != desired_save_path:
-        updates["save_path"] = desired_save_path
-        changes.append(f"Set default save path: {desired_save_path}")
-
-    # Mapped preferences
-    for config_key, api_key in _PREF_MAP.items():
-        if config_key not in desired_prefs:
-            continue
-
-        desired_value = desired_prefs[config_key]
-        # Translate config values to API values if needed
-        if config_key in _VALUE_MAP:
-            desired_value = _VALUE_MAP[config_key].get(desired_value, desired_value)
-
-        if current.get(api_key) != desired_value:
-            updates[api_key] = desired_value
-            changes.append(f"Set {api_key}: {desired_value}")
-
-    if updates:
-        import json
-
-        client.post("api/v2/app/setPreferences", data={"json": json.dumps(updates)})
-    else:
+    # The top-level default save path is diffed like any other mapped pref
+    desired_prefs = {
+        **qbit_cfg.get("preferences", {}),
+        "default_save_path": qbit_cfg["default_save_path"],
+    }
+
+    desired_mapped = {
+        api_key: translate(desired_prefs[config_key])
+        for config_key, (api_key, translate) in _COMPILED.items()
+        if config_key in desired_prefs
+    }
+    updates = {k: v for k, v in desired_mapped.items() if current.get(k) != v}
+
+    if not updates:
         log.info("qBittorrent: all preferences already correct")
+        return []
 
-    return changes
+    client.post("api/v2/app/setPreferences", data={"json": _dumps(updates)})
+    return [
+        f"Set {_CHANGE_LABELS.get(api_key, api_key)}: {value}"
+        for api_key, value in updates.items()
+    ]
 
 
 def _set_categories(client: QbitClient, qbit_cfg: dict) -> list[str]:
@@ -87,26 +119,41 @@ def _set_categories(client: QbitClient, qbit_cfg: dict) -> list[str]:
     current_cats = client.get("api/v2/torrents/categories")
     desired_cats = qbit_cfg.get("categories", {})
 
+    # (endpoint, form data, change message) for every diverging category
+    todo = []
     for cat_name, cat_cfg in desired_cats.items():
         desired_path = cat_cfg.get("save_path", cat_name)
+        data = {"category": cat_name, "savePath": desired_path}
 
         if cat_name not in current_cats:
             # Category doesn't exist — create it
-            client.post(
-                "api/v2/torrents/createCategory",
-                data={"category": cat_name, "savePath": desired_path},
+            todo.append(
+                (
+                    "api/v2/torrents/createCategory",
+                    data,
+                    f"Created category: {cat_name} (path: {desired_path})",
+                )
             )
-            changes.append(f"Created category: {cat_name} (path: {desired_path})")
 
         elif current_cats[cat_name].get("savePath") != desired_path:
             # Category exists but wrong path — update it
-            client.post(
-                "api/v2/torrents/editCategory",
-                data={"category": cat_name, "savePath": desired_path},
+            todo.append(
+                (
+                    "api/v2/torrents/editCategory",
+                    data,
+                    f"Updated category {cat_name} path: {desired_path}",
+                )
             )
-            changes.append(f"Updated category {cat_name} path: {desired_path}")
 
         else:
             log.info("qBittorrent: category %s already correct", cat_name)
 
+    if not todo:
+        return changes
+
+    # Categories are independent, so send the requests concurrently
+    with ThreadPoolExecutor(max_workers=min(8, len(todo))) as ex:
+        list(ex.map(lambda item: client.post(item[0], data=item[1]), todo))
+    changes.extend(message for _, _, message in todo)
+
     return changes
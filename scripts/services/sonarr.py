@@ -2,6 +2,7 @@
 
 import copy
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from lib.api_client import ArrClient
 
@@ -20,10 +21,17 @@ def configure_sonarr(
 
     changes = []
 
-    changes.extend(_ensure_root_folder(client, inst))
-    changes.extend(_ensure_download_client(client, config, inst))
-    changes.extend(_set_media_management(client, config))
-    changes.extend(_ensure_tags(client, config, service_name))
+    # Each step reads and writes a different endpoint, so run them together
+    tasks = [
+        (_ensure_root_folder, (client, inst)),
+        (_ensure_download_client, (client, config, inst)),
+        (_set_media_management, (client, config, inst)),
+        (_ensure_tags, (client, config, service_name)),
+    ]
+    with ThreadPoolExecutor(max_workers=len(tasks)) as ex:
+        futures = [ex.submit(func, *args) for func, args in tasks]
+        for future in futures:
+            changes.extend(future.result())
 
     return changes
 
@@ -34,12 +42,12 @@ def _ensure_root_folder(client: ArrClient, inst: dict) -> list[str]:
     folders = client.get("api/v3/rootfolder")
     desired = inst["root_folder"]
 
-    existing_paths = [f["path"] for f in folders]
+    existing_paths = {f["path"] for f in folders}
     if desired not in existing_paths:
         client.post("api/v3/rootfolder", json={"path": desired})
         changes.append(f"Added root folder: {desired}")
     else:
-        log.info("Root folder already exists: %s", desired)
+        log.info("%s: root folder already exists: %s", inst["name"], desired)
 
     return changes
 
@@ -86,23 +94,25 @@ def _ensure_download_client(client: ArrClient, config: dict, inst: dict) -> list
         client.post("api/v3/downloadclient", json=payload)
         changes.append("Added qBittorrent download client")
     else:
-        # Check if settings match
+        # Password is not returned by the API, so it never counts as a change
         current_fields = {f["name"]: f.get("value") for f in existing.get("fields", [])}
-        needs_update = False
-        for key, val in expected_fields.items():
-            if key == "password":
-                continue  # Password not returned by API
-            if current_fields.get(key) != val:
-                needs_update = True
-                break
-
-        if needs_update:
+        diff = {
+            k: v
+            for k, v in expected_fields.items()
+            if k != "password" and current_fields.get(k) != v
+        }
+
+        if diff:
+            # The PUT replaces the whole client (omitted fields reset to
+            # defaults), so send the full resource with the expected values
             payload = copy.deepcopy(existing)
             _set_fields(payload, expected_fields)
             client.put(f"api/v3/downloadclient/{existing['id']}", json=payload)
-            changes.append("Updated qBittorrent download client settings")
+            changes.append(
+                f"Updated qBittorrent download client settings: {', '.join(diff)}"
+            )
         else:
-            log.info("Download client already configured correctly")
+            log.info("%s: download client already configured correctly", inst["name"])
 
     return changes
 
@@ -114,7 +124,7 @@ def _set_fields(payload: dict, values: dict) -> None:
             field["value"] = values[field["name"]]
 
 
-def _set_media_management(client: ArrClient, config: dict) -> list[str]:
+def _set_media_management(client: ArrClient, config: dict, inst: dict) -> list[str]:
     """Check and update media management settings."""
     changes = []
     current = client.get("api/v3/config/mediamanagement")
@@ -143,11 +153,13 @@ def _set_media_management(client: ArrClient, config: dict) -> list[str]:
         changes.append(f"Set propers/repacks: {desired_propers}")
 
     if updates:
-        # Merge updates into current config and PUT back
+        # The endpoint replaces the whole resource: omitted keys are reset to
+        # their defaults, so the full current config must be sent back.
+        # Only `updates` is diffed; when it is empty no request is made.
         payload = {**current, **updates}
         client.put("api/v3/config/mediamanagement", json=payload)
     else:
-        log.info("Media management settings already correct")
+        log.info("%s: media management settings already correct", inst["name"])
 
     return changes
 
@@ -167,6 +179,6 @@ def _ensure_tags(client: ArrClient, config: dict, service_name: str) -> list[str
             client.post("api/v3/tag", json={"label": tag})
             changes.append(f"Created tag: {tag}")
         else:
-            log.info("Tag already exists: %s", tag)
+            log.info("%s: tag already exists: %s", service_name, tag)
 
     return changes
@@ -2,9 +2,12 @@
 """Main orchestrator — configures the Servarr stack in dependency order."""
 
 import argparse
+import functools
+import importlib
 import logging
 import os
 import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 # Ensure scripts/ is on the import path so lib/ and services/ resolve
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -13,13 +16,6 @@ from lib.config_loader import load_config
 from lib.logger import SummaryLogger
 from validate import validate
 
-from services.qbittorrent import configure_qbittorrent
-from services.sonarr import configure_sonarr
-from services.radarr import configure_radarr
-from services.prowlarr import configure_prowlarr
-from services.jellyfin import configure_jellyfin
-from services.jellyseerr import configure_jellyseerr
-
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
@@ -38,19 +34,56 @@ ALL_SERVICES = [
     "jellyseerr",
 ]
 
-# Map service names to their configure functions
+# Map service names to the services/ module holding their configure function
 # Sonarr/Sonarr2 share configure_sonarr; Radarr/Radarr2 share configure_radarr
-_CONFIGURE_FN = {
-    "qbittorrent": configure_qbittorrent,
-    "sonarr": configure_sonarr,
-    "sonarr2": configure_sonarr,
-    "radarr": configure_radarr,
-    "radarr2": configure_radarr,
-    "prowlarr": configure_prowlarr,
-    "jellyfin": configure_jellyfin,
-    "jellyseerr": configure_jellyseerr,
+_MODULE_MAP = {
+    "qbittorrent": "qbittorrent",
+    "sonarr": "sonarr",
+    "sonarr2": "sonarr",
+    "radarr": "radarr",
+    "radarr2": "radarr",
+    "prowlarr": "prowlarr",
+    "jellyfin": "jellyfin",
+    "jellyseerr": "jellyseerr",
+}
+
+# Services that must finish before another may start (when both are requested).
+# Arr download clients point at qBittorrent; Prowlarr and Jellyseerr connect
+# to the Arr instances. Everything else runs concurrently.
+_ARR_SERVICES = {"sonarr", "sonarr2", "radarr", "radarr2"}
+_DEPENDS_ON = {
+    "sonarr": {"qbittorrent"},
+    "sonarr2": {"qbittorrent"},
+    "radarr": {"qbittorrent"},
+    "radarr2": {"qbittorrent"},
+    "prowlarr": _ARR_SERVICES,
+    "jellyseerr": _ARR_SERVICES,
 }
 
+# Upper bound on services configured at once
+_MAX_WORKERS = 7
+
+
+@functools.lru_cache(maxsize=None)
+def _get_configure_fn(service_name: str):
+    """Import a service's configure function on first use.
+
+    Only the modules for requested services are loaded.
+    """
+    module_name = _MODULE_MAP[service_name]
+    module = importlib.import_module(f"services.{module_name}")
+    return getattr(module, f"configure_{module_name}")
+
+
+def _configure(config: dict, service_name: str, *, dry_run: bool) -> list[str]:
+    """Look up and run a service's configure function on a worker thread.
+
+    Doing the import here means a module that fails to load is reported as
+    that service failing, like any other configure error.
+    """
+    func = _get_configure_fn(service_name)
+    return func(config, service_name, dry_run=dry_run)
+
 
 def parse_services(raw: str) -> set[str]:
     """Parse the --services argument into a set of service names."""
@@ -67,6 +100,48 @@ def parse_services(raw: str) -> set[str]:
     return requested
 
 
+def run_services(
+    config: dict, services: list[str], summary: SummaryLogger, *, dry_run: bool
+):
+    """Configure services concurrently, honouring _DEPENDS_ON.
+
+    A service starts once every dependency that is also being configured
+    has finished (successfully or not). All summary updates happen on the
+    calling thread.
+    """
+    pending = list(services)
+    scheduled = set(services)
+    done: set[str] = set()
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as ex:
+
+        def submit_ready():
+            for service_name in list(pending):
+                deps = _DEPENDS_ON.get(service_name, set()) & scheduled
+                if deps <= done:
+                    pending.remove(service_name)
+                    summary.mark_in_progress(service_name)
+                    future = ex.submit(
+                        _configure, config, service_name, dry_run=dry_run
+                    )
+                    running[future] = service_name
+
+        submit_ready()
+        while running:
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                service_name = running.pop(future)
+                try:
+                    changes = future.result()
+                    summary.mark_success(service_name, changes)
+                except Exception as exc:
+                    log.exception("Error configuring %s", service_name)
+                    summary.mark_failed(service_name, str(exc))
+                done.add(service_name)
+            submit_ready()
+
+
 def main():
     parser = argparse.ArgumentParser(description="Ultra.cc Servarr Bootstrap")
     parser.add_argument(
@@ -84,6 +159,11 @@ def main():
         default="config/config.yml",
         help="Path to config file",
     )
+    parser.add_argument(
+        "--no-validate-cache",
+        action="store_true",
+        help="Probe every service even if it passed validation recently",
+    )
     args = parser.parse_args()
 
     dry_run = args.dry_run.lower() in ("true", "1", "yes")
@@ -98,30 +178,26 @@ def main():
     log.info("Requested services: %s", ", ".join(sorted(requested)))
 
     # Validate connectivity for requested services
-    reachable = validate(config, requested)
+    reachable, clients = validate(
+        config, requested, use_cache=not args.no_validate_cache
+    )
     log.info("Reachable services: %s", ", ".join(sorted(reachable)))
+    # Let configure steps reuse the sessions established during validation
+    config["_clients"] = clients
 
-    # Execute in dependency order
+    # Execute in dependency order, independent services in parallel. One pass
+    # over ALL_SERVICES keeps skipped and pending services in summary order.
+    to_run = []
     for service_name in ALL_SERVICES:
         if service_name not in requested:
             continue
-
         if service_name not in reachable:
             summary.log_skip(service_name, "unreachable")
             continue
+        summary.mark_pending(service_name)
+        to_run.append(service_name)
 
-        func = _CONFIGURE_FN.get(service_name)
-        if not func:
-            summary.log_skip(service_name, "no configure function")
-            continue
-
-        try:
-            summary.mark_in_progress(service_name)
-            changes = func(config, service_name, dry_run=dry_run)
-            summary.mark_success(service_name, changes)
-        except Exception as exc:
-            log.exception("Error configuring %s", service_name)
-            summary.mark_failed(service_name, str(exc))
+    run_services(config, to_run, summary, dry_run=dry_run)
 
     summary.print_summary()
     sys.exit(1 if summary.has_failures() else 0)
@@ -1,8 +1,16 @@
 """Connectivity validation — hit each service health endpoint before mutations."""
 
+import hashlib
+import json
 import logging
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
 
 from lib.api_client import ArrClient, QbitClient, JellyfinClient, JellyseerrClient
+from lib.http_pool import new_adapter, new_session
 
 log = logging.getLogger(__name__)
 
@@ -16,38 +24,144 @@ _HEALTH_ENDPOINTS = {
     "jellyseerr": ("jellyseerr", "api/v1/status"),
 }
 
+# Liveness probes get tighter (connect, read) timeouts than configure calls
+# and a single attempt, so an unreachable host is reported without waiting
+# out the retry backoff
+VALIDATE_TIMEOUT = (3, 10)
+VALIDATE_ADAPTER = new_adapter(retries=1)
 
-def validate(config: dict, requested: set[str]) -> set[str]:
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "ultra-servarr-bootstrap",
+)
+
+# Successful probes are remembered on disk for this many seconds
+CACHE_TTL = 60
+CACHE_PATH = os.path.join(CACHE_DIR, "validate.json")
+
+# qBittorrent SID cookies are reused for a cheap authenticated probe; keep
+# this below qBittorrent's default 3600s WebUI session timeout
+SID_TTL = 1800
+SID_CACHE_PATH = os.path.join(CACHE_DIR, "qbit_sid.json")
+
+
+def validate(
+    config: dict, requested: set[str], *, use_cache: bool = True
+) -> tuple[set[str], dict]:
     """Check connectivity for each requested service.
 
-    Returns the set of service names that are reachable.
+    Probes run concurrently since each is an independent round trip.
+    Services that passed within the last CACHE_TTL seconds are not probed
+    again unless use_cache is False. qBittorrent is always probed: its
+    check logs in, and configure_qbittorrent reuses that client.
+    Returns (reachable service names, {service: validated client}) so that
+    configure steps can reuse already-authenticated sessions.
     """
     reachable = set()
+    clients = {}
+    # Loaded even when use_cache is False so other services' entries survive
+    cache = _load_cache(CACHE_PATH)
+    now = time.time()
+    keys = {s: _cache_key(config, s) for s in requested if s != "qbittorrent"}
 
+    to_probe = set()
     for service_name in requested:
-        try:
-            if service_name == "qbittorrent":
-                _check_qbittorrent(config)
-            elif service_name in ("jellyfin",):
-                _check_jellyfin(config)
-            elif service_name in ("jellyseerr",):
-                _check_jellyseerr(config)
-            else:
-                _check_arr(config, service_name)
+        key = keys.get(service_name)
+        entry = cache.get(key) if use_cache and key else None
+        if entry and entry.get("ok") and now - entry.get("ts", 0) < CACHE_TTL:
+            log.info("[validate] %s: OK (cached)", service_name)
+            reachable.add(service_name)
+        else:
+            to_probe.add(service_name)
+
+    if not to_probe:
+        return reachable, clients
+
+    with ThreadPoolExecutor(max_workers=len(to_probe)) as ex:
+        futures = {
+            ex.submit(_dispatch, config, s, fast_check=use_cache): s for s in to_probe
+        }
+        for future in as_completed(futures):
+            service_name = futures[future]
+            try:
+                clients[service_name] = future.result()
+            except Exception as exc:
+                log.warning("[validate] %s: UNREACHABLE — %s", service_name, exc)
+                cache.pop(keys.get(service_name), None)
+                continue
 
             log.info("[validate] %s: OK", service_name)
             reachable.add(service_name)
+            if keys.get(service_name):
+                cache[keys[service_name]] = {"ts": now, "ok": True}
 
-        except Exception as exc:
-            log.warning("[validate] %s: UNREACHABLE — %s", service_name, exc)
+    _save_cache(CACHE_PATH, cache)
+    return reachable, clients
 
-    return reachable
 
+def _cache_key(config: dict, service_name: str) -> str | None:
+    """Fingerprint a service's URL and credentials without storing them.
 
-def _check_arr(config: dict, service_name: str):
+    Returns None for a service missing from config, so it is probed (and
+    reported UNREACHABLE) rather than crashing the run.
+    """
+    try:
+        if service_name == "qbittorrent":
+            qbit = config["qbittorrent"]
+            parts = (qbit["url"], qbit["username"], qbit["password"])
+        else:
+            inst = config["instances"][service_name]
+            parts = (inst["url"], inst.get("api_key", ""))
+    except KeyError:
+        return None
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def _load_cache(path: str) -> dict:
+    """Read a cache file, treating a missing or corrupt file as empty."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(path: str, cache: dict) -> None:
+    """Atomically rewrite a cache file; failures only cost a re-probe.
+
+    mkstemp creates the file owner-readable only, which matters for SIDs.
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        log.debug("Could not write validate cache %s: %s", path, exc)
+
+
+def _probe_kwargs() -> dict:
+    """Client arguments for a probe: its own Session on the no-retry adapter."""
+    return {"session": new_session(VALIDATE_ADAPTER), "timeout": VALIDATE_TIMEOUT}
+
+
+def _dispatch(config: dict, service_name: str, *, fast_check: bool = True):
+    """Run the connectivity check matching a service and return its client."""
+    if service_name == "qbittorrent":
+        return _check_qbittorrent(config, fast_check=fast_check)
+    elif service_name in ("jellyfin",):
+        return _check_jellyfin(config)
+    elif service_name in ("jellyseerr",):
+        return _check_jellyseerr(config)
+    else:
+        return _check_arr(config, service_name)
+
+
+def _check_arr(config: dict, service_name: str) -> ArrClient:
     """Validate an Arr instance (Sonarr, Radarr, Prowlarr)."""
     inst = config["instances"][service_name]
-    client = ArrClient(inst["url"], inst["api_key"])
+    client = ArrClient(inst["url"], inst["api_key"], **_probe_kwargs())
 
     svc_type = inst.get("type", service_name)
     if svc_type in ("sonarr", "radarr"):
@@ -57,24 +171,58 @@ def _check_arr(config: dict, service_name: str):
         endpoint = "api/v1/system/status"
 
     client.get(endpoint)
+    return client
 
 
-def _check_qbittorrent(config: dict):
-    """Validate qBittorrent by logging in."""
-    qbit = config["qbittorrent"]
-    client = QbitClient(qbit["url"], qbit["username"], qbit["password"])
-    client.login()
-
+def _check_qbittorrent(config: dict, *, fast_check: bool = True) -> QbitClient:
+    """Validate qBittorrent.
 
-def _check_jellyfin(config: dict):
+    With fast_check and a SID cookie cached from a recent run, a plain
+    GET api/v2/app/version is enough; if the SID has expired the client's
+    lazy auth logs in on the 403 and retries. Otherwise log in directly.
+    The resulting SID is cached for the next run.
+    """
+    qbit = config["qbittorrent"]
+    client = QbitClient(
+        qbit["url"], qbit["username"], qbit["password"], **_probe_kwargs()
+    )
+    host = urlparse(qbit["url"]).hostname
+    key = _cache_key(config, "qbittorrent")
+
+    sids = _load_cache(SID_CACHE_PATH)
+    entry = sids.get(key) if fast_check else None
+    if entry and time.time() - entry.get("ts", 0) < SID_TTL:
+        client.session.cookies.set("SID", entry["sid"], domain=host, path="/")
+        client.get("api/v2/app/version")
+    else:
+        client.login()
+
+    # qBittorrent extends a session on activity, so refresh the timestamp too
+    sid = next(
+        (
+            c.value
+            for c in client.session.cookies
+            if c.name == "SID" and host in c.domain
+        ),
+        None,
+    )
+    if sid:
+        sids[key] = {"sid": sid, "ts": time.time()}
+        _save_cache(SID_CACHE_PATH, sids)
+    return client
+
+
+def _check_jellyfin(config: dict) -> JellyfinClient:
     """Validate Jellyfin."""
     inst = config["instances"]["jellyfin"]
-    client = JellyfinClient(inst["url"], inst["api_key"])
+    client = JellyfinClient(inst["url"], inst["api_key"], **_probe_kwargs())
     client.get("System/Info")
+    return client
 
 
-def _check_jellyseerr(config: dict):
+def _check_jellyseerr(config: dict) -> JellyseerrClient:
     """Validate Jellyseerr."""
     inst = config["instances"]["jellyseerr"]
-    client = JellyseerrClient(inst["url"], inst["api_key"])
+    client = JellyseerrClient(inst["url"], inst["api_key"], **_probe_kwargs())
     client.get("api/v1/status")
+    return client